@@ -2,15 +2,20 @@ from pydantic import BaseModel, Field
 from typing import Optional, List
 from datetime import datetime, timezone
 
+# Nilai yang diizinkan untuk kolom enum (dipakai juga untuk validasi Excel)
+SOURCE_VALUES = ("pusaka_chat", "internal_system")
+CATEGORY_VALUES = ("product", "service")
+PURCHASE_TYPE_VALUES = ("online", "offline")
+
 class ReviewModel(BaseModel):
     username: str = Field(..., description="User identifier (mandatory)")
     created_by: str = Field(..., description="Created by user or anonymous")
-    source: str = Field(..., pattern="^(pusaka_chat|internal_system)$", description="Source of the review")
+    source: str = Field(..., pattern=f"^({'|'.join(SOURCE_VALUES)})$", description="Source of the review")
     review_title: str = Field(..., description="Title of the review")
-    category: str = Field(..., pattern="^(product|service)$", description="Category of the review")
+    category: str = Field(..., pattern=f"^({'|'.join(CATEGORY_VALUES)})$", description="Category of the review")
     price: int = Field(..., description="Price of the product/service (0 if free)")
     specifications: Optional[str] = Field(None, description="Product/service specifications")
-    purchase_type: str = Field(..., pattern="^(online|offline)$", description="Type of purchase")
+    purchase_type: str = Field(..., pattern=f"^({'|'.join(PURCHASE_TYPE_VALUES)})$", description="Type of purchase")
     store_name: Optional[str] = Field(None, description="Name of store/service provider")
     purchase_date: Optional[datetime] = Field(None, description="Purchase date (UTC format)")
     purchase_link: Optional[str] = Field(None, description="Purchase link or store address")
@@ -1,9 +1,11 @@
 import pandas as pd
-import numpy as np
 from bson import ObjectId
 from fastapi import File, UploadFile, APIRouter, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from app.models.review_model import ReviewModel
+from app.services.admission_service import ingest_pool, read_pool
 from app.services.database import reviews_collection
+from app.services.excel_import_service import validate_review_sheet
 from datetime import datetime, timezone
 from app.services.supabase_service import delete_from_supabase, is_image_url, download_image, upload_to_supabase
 from app.utils.utils import array_like_search, parse_comma_separated, sql_like_search, trim_value
@@ -11,8 +13,38 @@ import io
 
 router = APIRouter()
 
+def upload_review_images(username: str, image_urls: list) -> list:
+    """
+    Upload valid image URLs to Supabase and return the resulting blob URLs.
+    Blocking (outbound HTTP), so call it via run_in_threadpool.
+    """
+    uploaded_image_urls = []
+
+    for image_url in image_urls:
+        # Cek apakah URL adalah image/*
+        if not is_image_url(image_url):
+            print(f"Skipped non-image URL: {image_url}")
+            continue
+
+        image_bytes = download_image(image_url)
+        if not image_bytes:
+            print(f"Skipping {image_url} due to download failure or invalid content.")
+            continue
+
+        blob_url = upload_to_supabase(username, image_bytes)
+        if blob_url:
+            uploaded_image_urls.append(blob_url)
+        else:
+            print(f"Skipping {image_url} due to upload failure.")
+
+    return uploaded_image_urls
+
 @router.post("/api/reviews", response_description="Create a new review")
 async def create_review(request: Request):
+    async with ingest_pool.slot():
+        return await _create_review(request)
+
+async def _create_review(request: Request):
     # Ambil payload mentah
     raw_body = await request.json()
 
@@ -42,25 +74,11 @@ async def create_review(request: Request):
     # Validasi dengan Pydantic setelah konversi
     review = ReviewModel(**raw_body)
     review_data = review.model_dump()
-    
-    uploaded_image_urls = []
 
-    for image_url in review_data.get("image_urls", []):
-        # Cek apakah URL adalah image/*
-        if not is_image_url(image_url):
-            print(f"Skipped non-image URL: {image_url}")
-            continue
-
-        image_bytes = download_image(image_url)
-        if not image_bytes:
-            print(f"Skipping {image_url} due to download failure or invalid content.")
-            continue
-
-        blob_url = upload_to_supabase(review_data["username"], image_bytes)
-        if blob_url:
-            uploaded_image_urls.append(blob_url)
-        else:
-            print(f"Skipping {image_url} due to upload failure.")
+    # Upload gambar di threadpool agar event loop tetap melayani request read
+    uploaded_image_urls = await run_in_threadpool(
+        upload_review_images, review_data["username"], review_data.get("image_urls", [])
+    )
 
     # Simpan hanya URL hasil upload yang berhasil
     review_data["image_urls"] = uploaded_image_urls
@@ -70,13 +88,17 @@ async def create_review(request: Request):
 
     # Simpan ke MongoDB
     try:
-        result = reviews_collection.insert_one(review_data)
+        result = await run_in_threadpool(reviews_collection.insert_one, review_data)
         return {"status": "success", "message": "Review created successfully", "review_id": str(result.inserted_id)}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error saving review: {e}")
 
 @router.post("/api/reviews/search", response_description="Search reviews with total data")
 async def search_reviews(request: Request):
+    async with read_pool.slot():
+        return await _search_reviews(request)
+
+async def _search_reviews(request: Request):
     body = await request.json()
     query = {}
 
@@ -126,11 +148,11 @@ async def search_reviews(request: Request):
         }
 
     # Total data matching (tanpa limit)
-    total_data = reviews_collection.count_documents(query)
+    total_data = await run_in_threadpool(reviews_collection.count_documents, query)
 
     # Query Execution (with limit)
     limit = body.get("limit", 30)
-    results = list(reviews_collection.find(query).limit(limit))
+    results = await run_in_threadpool(lambda: list(reviews_collection.find(query).limit(limit)))
     returned_data = len(results)
 
     for review in results:
@@ -145,13 +167,17 @@ async def search_reviews(request: Request):
 
 @router.post("/api/reviews/detail", response_description="Get review detail by review_id")
 async def get_review_detail(request: Request):
+    async with read_pool.slot():
+        return await _get_review_detail(request)
+
+async def _get_review_detail(request: Request):
     body = await request.json()  # Terima filter dari body
 
     if "review_id" not in body or not body["review_id"]:
         raise HTTPException(status_code=400, detail="Review ID is required")
 
     try:
-        review = reviews_collection.find_one({"_id": ObjectId(body["review_id"])})
+        review = await run_in_threadpool(reviews_collection.find_one, {"_id": ObjectId(body["review_id"])})
         if not review:
             raise HTTPException(status_code=404, detail="Review not found")
 
@@ -162,6 +188,10 @@ async def get_review_detail(request: Request):
 
 @router.post("/api/reviews/get-by-username", response_description="Get all reviews by username")
 async def get_reviews_by_username(request: Request):
+    async with read_pool.slot():
+        return await _get_reviews_by_username(request)
+
+async def _get_reviews_by_username(request: Request):
     body = await request.json()
     username = body.get("username")
 
@@ -169,7 +199,7 @@ async def get_reviews_by_username(request: Request):
         raise HTTPException(status_code=400, detail="Username is required")
 
     query = {"username": username}
-    reviews = list(reviews_collection.find(query))
+    reviews = await run_in_threadpool(lambda: list(reviews_collection.find(query)))
     
     for review in reviews:
         review["_id"] = str(review["_id"])
@@ -235,83 +265,33 @@ async def upload_reviews_from_excel(file: UploadFile = File(...)):
     if not file.filename.endswith(('.xls', '.xlsx')):
         raise HTTPException(status_code=400, detail="Only Excel files are accepted")
 
+    # Admission di luar try agar 429 tidak dibungkus menjadi 500
+    async with ingest_pool.slot():
+        return await _upload_reviews_from_excel(file)
+
+async def _upload_reviews_from_excel(file: UploadFile):
     try:
         # ✅ Load Excel ke DataFrame
         contents = await file.read()
-        excel_data = pd.read_excel(io.BytesIO(contents))
+        excel_data = await run_in_threadpool(pd.read_excel, io.BytesIO(contents))
 
-        # ✅ Konversi semua NaN ke None (Agar JSON valid)
-        excel_data = excel_data.replace({np.nan: None})
-
-        # ✅ Ubah kolom jadi snake_case
-        excel_data.columns = [col.strip().lower().replace(" ", "_") for col in excel_data.columns]
+        # ✅ Normalisasi kolom (trim, split tags/image_urls, NaN -> None, cek enum) & validasi batch
+        valid_rows, error_logs = await run_in_threadpool(validate_review_sheet, excel_data)
 
         inserted_count = 0
-        error_logs = []
-
-        for idx, row in excel_data.iterrows():
-            row_number = idx + 2  # Karena header di baris 1
-
-            # ✅ Konversi row ke dict
-            row_dict = row.to_dict()
-
-            # ✅ Trim semua string
-            row_dict = {key: trim_value(value) for key, value in row_dict.items()}
-
-            # ✅ Konversi tags (comma-separated string) menjadi array
-            if "tags" in row_dict:
-                if isinstance(row_dict["tags"], str):
-                    row_dict["tags"] = [tag.strip() for tag in parse_comma_separated(row_dict["tags"])]
-                elif row_dict["tags"] is None:
-                    row_dict["tags"] = []
-                else:
-                    row_dict["tags"] = trim_value(row_dict["tags"])
-            else:
-                row_dict["tags"] = []
-            
-            # ✅ Konversi image_urls (comma-separated string) menjadi array
-            if "image_urls" in row_dict:
-                if isinstance(row_dict["image_urls"], str):
-                    row_dict["image_urls"] = [url.strip() for url in parse_comma_separated(row_dict["image_urls"])]
-                elif row_dict["image_urls"] is None:
-                    row_dict["image_urls"] = []
-                else:
-                    row_dict["image_urls"] = trim_value(row_dict["image_urls"])
-            else:
-                row_dict["image_urls"] = []
-
-            # ✅ Tambahkan created_at otomatis
-            row_dict["created_at"] = datetime.now(timezone.utc)
 
+        for row_number, row_dict, review_data in valid_rows:
             try:
-                # ✅ Validasi dengan Pydantic Model
-                review = ReviewModel(**row_dict)
-                review_data = review.model_dump()
-                
-                # ✅ Proses Upload Gambar ke Supabase
-                uploaded_image_urls = []
-
-                for image_url in review_data.get("image_urls", []):
-                    if not is_image_url(image_url):
-                        print(f"Skipped non-image URL: {image_url}")
-                        continue
-
-                    image_bytes = download_image(image_url)
-                    if not image_bytes:
-                        print(f"Skipping {image_url} due to download failure.")
-                        continue
-
-                    blob_url = upload_to_supabase(review_data["username"], image_bytes)
-                    if blob_url:
-                        uploaded_image_urls.append(blob_url)
-                    else:
-                        print(f"Skipping {image_url} due to upload failure.")
+                # ✅ Proses Upload Gambar ke Supabase (di threadpool)
+                uploaded_image_urls = await run_in_threadpool(
+                    upload_review_images, review_data["username"], review_data.get("image_urls", [])
+                )
 
                 # ✅ Update image_urls dengan URL dari Supabase
                 review_data["image_urls"] = uploaded_image_urls
 
                 # ✅ Insert ke MongoDB
-                reviews_collection.insert_one(review_data)
+                await run_in_threadpool(reviews_collection.insert_one, review_data)
                 inserted_count += 1
 
             except Exception as e:
@@ -322,6 +302,8 @@ async def upload_reviews_from_excel(file: UploadFile = File(...)):
                     "row_data": {k: v if v is not None else "" for k, v in row_dict.items()}
                 })
 
+        error_logs.sort(key=lambda log: log["row_number"])
+
         # ✅ Return hasil: Inserted + Error Logs
         return {
             "status": "success",
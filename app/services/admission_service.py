@@ -0,0 +1,97 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from dotenv import load_dotenv
+from fastapi import HTTPException
+
+# Load environment variables
+load_dotenv()
+
+# Ambil konfigurasi dari environment (dengan default yang aman)
+INGEST_MAX_CONCURRENCY = int(os.getenv("INGEST_MAX_CONCURRENCY", 4))
+INGEST_MAX_QUEUE = int(os.getenv("INGEST_MAX_QUEUE", 16))
+INGEST_QUEUE_TIMEOUT = float(os.getenv("INGEST_QUEUE_TIMEOUT", 30))
+READ_MAX_CONCURRENCY = int(os.getenv("READ_MAX_CONCURRENCY", 32))
+READ_MAX_QUEUE = int(os.getenv("READ_MAX_QUEUE", 128))
+READ_QUEUE_TIMEOUT = float(os.getenv("READ_QUEUE_TIMEOUT", 5))
+RETRY_AFTER_SECONDS = int(os.getenv("ADMISSION_RETRY_AFTER", 5))
+
+class AdmissionPool:
+    """
+    Concurrency pool with a bounded wait queue.
+
+    At most `max_concurrency` requests run at once. Up to `max_queue` more
+    wait for a slot; anything beyond that (or waiting longer than
+    `queue_timeout` seconds) is rejected immediately with 429 + Retry-After.
+    """
+
+    def __init__(self, name: str, max_concurrency: int, max_queue: int, queue_timeout: float):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+        # Metrics
+        self.in_flight = 0
+        self.queue_depth = 0
+        self.max_queue_depth_seen = 0
+        self.admitted_total = 0
+        self.rejected_total = 0
+
+    def _reject(self, reason: str):
+        self.rejected_total += 1
+        raise HTTPException(
+            status_code=429,
+            detail=f"Server busy ({self.name}): {reason}. Please retry later.",
+            headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+        )
+
+    @asynccontextmanager
+    async def slot(self):
+        # Fast-fail sebelum await apa pun, agar burst serentak tetap dibatasi
+        if self.in_flight + self.queue_depth >= self.max_concurrency + self.max_queue:
+            self._reject("queue is full")
+
+        if not self._semaphore.locked():
+            # Slot kosong: acquire langsung selesai tanpa masuk antrean
+            await self._semaphore.acquire()
+        else:
+            self.queue_depth += 1
+            self.max_queue_depth_seen = max(self.max_queue_depth_seen, self.queue_depth)
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), timeout=self.queue_timeout)
+            except asyncio.TimeoutError:
+                self._reject("timed out waiting in queue")
+            finally:
+                self.queue_depth -= 1
+
+        self.in_flight += 1
+        self.admitted_total += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self._semaphore.release()
+
+    def metrics(self) -> dict:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth_seen": self.max_queue_depth_seen,
+            "admitted_total": self.admitted_total,
+            "rejected_total": self.rejected_total,
+        }
+
+# Pool terpisah: ingestion (image I/O berat) tidak boleh menghabiskan slot untuk read
+ingest_pool = AdmissionPool("ingest", INGEST_MAX_CONCURRENCY, INGEST_MAX_QUEUE, INGEST_QUEUE_TIMEOUT)
+read_pool = AdmissionPool("read", READ_MAX_CONCURRENCY, READ_MAX_QUEUE, READ_QUEUE_TIMEOUT)
+
+def get_admission_metrics() -> dict:
+    """Snapshot of admission metrics for all pools."""
+    return {
+        "ingest": ingest_pool.metrics(),
+        "read": read_pool.metrics(),
+    }
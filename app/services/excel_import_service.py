@@ -0,0 +1,106 @@
+import pandas as pd
+from datetime import datetime, timezone
+from typing import Annotated, List, Optional, Tuple
+from pydantic import TypeAdapter, ValidationError, WrapValidator
+from app.models.review_model import ReviewModel, SOURCE_VALUES, CATEGORY_VALUES, PURCHASE_TYPE_VALUES
+from app.utils.utils import find_invalid_enum_values, nan_to_none, split_comma_separated_column, trim_dataframe
+
+LIST_COLUMNS = ("tags", "image_urls")
+ENUM_COLUMNS = {
+    "source": SOURCE_VALUES,
+    "category": CATEGORY_VALUES,
+    "purchase_type": PURCHASE_TYPE_VALUES,
+}
+
+def _capture_row_errors(value, handler):
+    # Kembalikan ValidationError per baris alih-alih menggagalkan seluruh batch
+    try:
+        return handler(value)
+    except ValidationError as e:
+        # Pakai judul model agar pesan sama dengan str(ValidationError) dari ReviewModel(**row)
+        line_errors = [
+            {"type": err["type"], "loc": err["loc"], "input": err["input"], **({"ctx": err["ctx"]} if "ctx" in err else {})}
+            for err in e.errors()
+        ]
+        return ValidationError.from_exception_data(ReviewModel.__name__, line_errors)
+
+review_list_adapter = TypeAdapter(List[ReviewModel])
+review_row_adapter = TypeAdapter(List[Annotated[ReviewModel, WrapValidator(_capture_row_errors)]])
+
+def normalize_review_sheet(excel_data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Normalize a raw review sheet column-wise:
+    snake_case headers, trimmed strings, list columns split on commas, NaN -> None.
+    """
+    df = excel_data.copy()
+    df.columns = [str(col).strip().lower().replace(" ", "_") for col in df.columns]
+
+    df = trim_dataframe(df)
+
+    for col in LIST_COLUMNS:
+        if col in df.columns:
+            df[col] = split_comma_separated_column(df[col])
+
+    df = nan_to_none(df)
+
+    for col in LIST_COLUMNS:
+        if col not in df.columns:
+            df[col] = [[] for _ in range(len(df))]
+
+    return df
+
+def _error_log(row_number: int, error_message: str, row_dict: dict, enum_errors: List[str] = None) -> dict:
+    log = {
+        "row_number": row_number,
+        "error_message": error_message,
+        "row_data": {k: v if v is not None else "" for k, v in row_dict.items()}
+    }
+    if enum_errors:
+        log["enum_errors"] = enum_errors
+    return log
+
+def validate_review_sheet(
+    excel_data: pd.DataFrame, created_at: Optional[datetime] = None
+) -> Tuple[List[Tuple[int, dict, dict]], List[dict]]:
+    """
+    Normalize and validate all rows of a review sheet in batch.
+
+    `error_message` is str(ValidationError) per row, same as ReviewModel(**row).
+    Rows with an invalid source/category/purchase_type also get `enum_errors`.
+
+    Returns:
+        tuple: (valid rows as (row_number, row_dict, review_data), error logs)
+    """
+    df = normalize_review_sheet(excel_data)
+    enum_errors = find_invalid_enum_values(df, ENUM_COLUMNS)
+
+    # Bangun dict per baris dari list per kolom (lebih cepat dari df.to_dict("records"))
+    columns = list(df.columns)
+    created_at = created_at or datetime.now(timezone.utc)
+    records = [
+        dict(zip(columns, values), created_at=created_at)
+        for values in zip(*(df[col].tolist() for col in columns))
+    ]
+
+    # Validasi semua baris dalam satu panggilan TypeAdapter; error per baris dikembalikan, bukan di-raise
+    results = review_row_adapter.validate_python(records)
+
+    valid_models = []
+    valid_rows = []
+    error_logs = []
+    for idx, record, result in zip(df.index.tolist(), records, results):
+        row_number = idx + 2  # Karena header di baris 1
+        row_enum_errors = enum_errors.get(idx)
+
+        if isinstance(result, ValidationError):
+            error_logs.append(_error_log(row_number, str(result), record, row_enum_errors))
+        elif row_enum_errors:
+            error_logs.append(_error_log(row_number, "; ".join(row_enum_errors), record, row_enum_errors))
+        else:
+            valid_models.append(result)
+            valid_rows.append((row_number, record))
+
+    review_data = review_list_adapter.dump_python(valid_models)
+    valid_rows = [(row_number, record, data) for (row_number, record), data in zip(valid_rows, review_data)]
+
+    return valid_rows, error_logs
@@ -1,4 +1,5 @@
-from typing import List
+from typing import Dict, Iterable, List
+import pandas as pd
 import re
 
 def sql_like_search(value: str) -> dict:
@@ -47,3 +48,64 @@ def trim_value(value):
     elif isinstance(value, list):
         return [item.strip() if isinstance(item, str) else item for item in value]
     return value
+
+def _string_mask(series: pd.Series) -> pd.Series:
+    """Boolean mask of cells that are str (the .str accessor rejects other columns)."""
+    return series.map(lambda value: isinstance(value, str)).astype(bool)
+
+def trim_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Column-wise version of trim_value: strip every string cell of a DataFrame.
+    Non-string cells (numbers, booleans, dates, NaN) are left untouched.
+    """
+    df = df.copy()
+    for col in df.columns[df.dtypes == object]:
+        is_str = _string_mask(df[col])
+        if is_str.any():
+            df.loc[is_str, col] = df.loc[is_str, col].str.strip()
+    return df
+
+def split_comma_separated_column(series: pd.Series) -> pd.Series:
+    """
+    Column-wise version of parse_comma_separated (with trimmed items).
+    Empty or missing cells become [], non-string cells are left untouched.
+    """
+    result = series.astype(object)
+    is_str = _string_mask(series)
+    stripped = result[is_str].str.strip() if is_str.any() else result[is_str]
+
+    is_empty = result.isna()
+    is_empty[stripped.index] = stripped.eq("")
+    empty_lists = pd.Series([[] for _ in range(len(result))], index=result.index, dtype=object)
+    result = result.where(~is_empty, empty_lists)
+
+    # Strip luar + split pada koma beserta spasinya = setiap item ter-trim
+    stripped = stripped[stripped.ne("")]
+    if len(stripped):
+        result.loc[stripped.index] = stripped.str.split(r"\s*,\s*", regex=True)
+    return result
+
+def nan_to_none(df: pd.DataFrame) -> pd.DataFrame:
+    """Replace NaN/NaT with None so values are JSON/Pydantic friendly."""
+    return df.astype(object).where(df.notna(), None)
+
+def find_invalid_enum_values(df: pd.DataFrame, enum_columns: Dict[str, Iterable[str]]) -> Dict[int, List[str]]:
+    """
+    Check enum columns with vectorized isin.
+    Missing values are ignored (left for the model to report as required).
+
+    Returns:
+        dict: Row index -> list of error messages
+    """
+    errors: Dict[int, List[str]] = {}
+
+    for col, allowed in enum_columns.items():
+        if col not in df.columns:
+            continue
+
+        allowed = list(allowed)
+        invalid = df[col].notna() & ~df[col].isin(allowed)
+        for idx, value in df.loc[invalid, col].items():
+            errors.setdefault(idx, []).append(f"{col}: '{value}' is not one of {allowed}")
+
+    return errors
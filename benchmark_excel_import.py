@@ -0,0 +1,108 @@
+import argparse
+import io
+import time
+import numpy as np
+import pandas as pd
+from datetime import datetime, timezone
+from app.models.review_model import ReviewModel
+from app.services.excel_import_service import validate_review_sheet
+from app.utils.utils import parse_comma_separated, trim_value
+
+# Benchmark normalisasi + validasi Excel (tanpa upload gambar / MongoDB)
+# Jalankan: python benchmark_excel_import.py --rows 100000 [--excel]
+
+SCENARIOS = ("mixed", "blank-lists", "non-string")
+
+def build_sheet(rows: int, scenario: str = "mixed") -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    sources = np.array(["pusaka_chat", "internal_system", "unknown"])
+    sheet = pd.DataFrame({
+        "Username": [f" user_{i % 500} " for i in range(rows)],
+        "Created By": "anonymous",
+        "Source": sources[rng.choice(3, size=rows, p=[0.49, 0.49, 0.02])],
+        "Review Title": [f"  Review {i}  " for i in range(rows)],
+        "Category": rng.choice(["product", "service"], size=rows),
+        "Price": rng.integers(0, 5_000_000, size=rows),
+        "Specifications": "ram:8GB,storage:256GB",
+        "Purchase Type": rng.choice(["online", "offline"], size=rows),
+        "Store Name": np.where(rng.random(rows) < 0.2, None, "Shopee"),
+        "Purchase Date": pd.Timestamp("2025-03-01"),
+        "Purchase Link": "https://shopee.com/product/123",
+        "Review Content": "Super fast and battery life is great!",
+        "Rating": rng.integers(0, 6, size=rows),  # 0 = invalid
+        "Tags": np.where(rng.random(rows) < 0.1, None, "smartphone , apple,  android"),
+        "Image Urls": np.where(rng.random(rows) < 0.5, None, "https://img.com/1.jpg, https://img.com/2.jpg"),
+    })
+
+    if scenario == "blank-lists":
+        # Kolom kosong semua dibaca pd.read_excel sebagai float64 NaN
+        sheet["Tags"] = np.full(rows, np.nan)
+        sheet["Image Urls"] = np.full(rows, np.nan)
+    elif scenario == "non-string":
+        # Kolom object tanpa string (bool + kosong) dan tags berisi angka saja
+        sheet["Verified"] = np.where(rng.random(rows) < 0.3, None, rng.random(rows) < 0.5).astype(object)
+        sheet["Tags"] = np.where(rng.random(rows) < 0.5, None, 7).astype(object)
+        # Baris dengan beberapa error sekaligus (enum + field wajib kosong + rating)
+        sheet.loc[::10, "Review Content"] = None
+
+    return sheet
+
+def legacy_validate(excel_data: pd.DataFrame, created_at: datetime):
+    """Per-row path used before the vectorized import (validation only)."""
+    excel_data = excel_data.replace({np.nan: None})
+    excel_data.columns = [col.strip().lower().replace(" ", "_") for col in excel_data.columns]
+
+    valid_rows, error_logs = [], []
+    for idx, row in excel_data.iterrows():
+        row_dict = {key: trim_value(value) for key, value in row.to_dict().items()}
+        for col in ("tags", "image_urls"):
+            value = row_dict.get(col)
+            if isinstance(value, str):
+                row_dict[col] = [item.strip() for item in parse_comma_separated(value)]
+            elif value is None:
+                row_dict[col] = []
+        row_dict["created_at"] = created_at
+        try:
+            valid_rows.append((idx + 2, row_dict, ReviewModel(**row_dict).model_dump()))
+        except Exception as e:
+            error_logs.append({"row_number": idx + 2, "error_message": str(e)})
+    return valid_rows, error_logs
+
+def timed(label: str, func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    valid_rows, error_logs = result
+    print(f"{label:<12} {elapsed:8.2f}s  valid={len(valid_rows)}  errors={len(error_logs)}")
+    return result
+
+def run_scenario(rows: int, scenario: str, excel: bool):
+    print(f"Scenario: {scenario} ({rows} rows)")
+    sheet = build_sheet(rows, scenario)
+    if excel:
+        buffer = io.BytesIO()
+        start = time.perf_counter()
+        sheet.to_excel(buffer, index=False)
+        sheet = pd.read_excel(io.BytesIO(buffer.getvalue()))
+        print(f"{'xlsx i/o':<12} {time.perf_counter() - start:8.2f}s")
+
+    created_at = datetime.now(timezone.utc)
+    legacy_valid, legacy_errors = timed("legacy", legacy_validate, sheet, created_at)
+    batch_valid, batch_errors = timed("vectorized", validate_review_sheet, sheet, created_at)
+
+    # Pastikan hasil kedua jalur sama, termasuk pesan error
+    assert [n for n, _, _ in legacy_valid] == [n for n, _, _ in batch_valid]
+    assert [a for _, _, a in legacy_valid] == [b for _, _, b in batch_valid]
+    assert [(e["row_number"], e["error_message"]) for e in legacy_errors] == \
+        [(e["row_number"], e["error_message"]) for e in batch_errors]
+    print("Results match.")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--scenario", choices=SCENARIOS, help="Run one scenario only (default: all)")
+    parser.add_argument("--excel", action="store_true", help="Round-trip the sheet through an .xlsx file first")
+    args = parser.parse_args()
+
+    for scenario in [args.scenario] if args.scenario else SCENARIOS:
+        run_scenario(args.rows, scenario, args.excel)
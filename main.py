@@ -3,6 +3,7 @@ import uvicorn
 import os
 from dotenv import load_dotenv
 from app.routes import reviews, wishlist
+from app.services.admission_service import get_admission_metrics
 
 # Load environment variables
 load_dotenv(dotenv_path=".env")
@@ -17,6 +18,10 @@ app.include_router(wishlist.router)
 def home():
     return {"message": "Welcome to KataKonsumen API"}
 
+@app.get("/api/metrics/admission")
+def admission_metrics():
+    return {"status": "success", "pools": get_admission_metrics()}
+
 if __name__ == "__main__":
     port = int(os.getenv("PORT", 8000))  # Default ke 8000 jika tidak ada PORT di .env
     print(f"Running on port: {port}")   # Cek apakah port terbaca